@@ -1,6 +1,29 @@
 import csv
 import os
-from datetime import datetime
+import re
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from collections import namedtuple
+from operator import attrgetter, itemgetter
+
+Expense = namedtuple("Expense", ["id", "amount", "category", "date", "note"])
+
+DATE_PATTERN = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")  # YYYY-MM-DD
+
+def normalize_date(date):
+    # older versions stored dates as typed, e.g. 2024-1-5; pad them so they sort as strings
+    if len(date) != 10:
+        parts = date.split("-")
+        if len(parts) == 3:
+            date = f"{parts[0]}-{parts[1]:0>2}-{parts[2]:0>2}"
+    return date
+
+def parse_id(value):
+    # ids rewritten by the Streamlit import can read as "2.0", or be blank
+    try:
+        return int(float(value))
+    except:
+        return None
 
 class ExpenseManager:
     FILE_NAME = "storage.csv"
@@ -9,41 +32,121 @@ class ExpenseManager:
         if not os.path.exists(self.FILE_NAME):
             with open(self.FILE_NAME, "w", newline="") as file:
                 writer = csv.writer(file)
-                writer.writerow(["id", "amount", "category", "date", "note"])
-
-    def load_expenses(self):
-        expenses = []
+                writer.writerow(Expense._fields)
+
+        # parsed rows, reused until the file's mtime/size changes
+        self._cache = None
+        self._cache_key = None
+        self._last_id = None        # highest id, found on the first add
+        self._in_field_order = True
+        self._reset_indexes()
+
+    def _reset_indexes(self):
+        # lookup structures over the cached rows, each built on first use
+        self._monthly = None        # {"YYYY-MM": {category: total}}
+        self._by_date = None        # rows sorted by date
+        self._dates = None          # dates of self._by_date, for bisect
+        self._by_category = None    # {casefolded category: [rows]}
+
+    def _file_key(self):
+        stat = os.stat(self.FILE_NAME)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_rows(self):
         with open(self.FILE_NAME, "r") as file:
-            reader = csv.DictReader(file)
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            self._in_field_order = header == list(Expense._fields)
+            if self._in_field_order:
+                pick = None
+            else:
+                # columns in another order, e.g. a CSV imported through the Streamlit app
+                pick = itemgetter(*(header.index(field) for field in Expense._fields))
+
+            width = len(header)
             for row in reader:
-                expenses.append(row)
+                if not row:
+                    continue
+                if len(row) < width:
+                    # short, hand-edited line: missing fields read as empty
+                    row += [""] * (width - len(row))
+                elif len(row) > width:
+                    del row[width:]
+
+                exp = Expense._make(pick(row) if pick else row)
+                if len(exp.date) != 10:
+                    exp = exp._replace(date=normalize_date(exp.date))
+                yield exp
+
+    def iter_expenses(self):
+        # stream rows without materializing the file, unless already cached
+        if self._cache_key == self._file_key():
+            yield from self._cache
+        else:
+            yield from self._read_rows()
+
+    def load_expenses(self):
+        key = self._file_key()
+        if key == self._cache_key:
+            return self._cache
+
+        expenses = list(self._read_rows())
+
+        self._last_id = None
+        self._cache = expenses
+        self._cache_key = key
+        self._reset_indexes()
         return expenses
 
     def save_expenses(self, expenses):
         with open(self.FILE_NAME, "w", newline="") as file:
-            fieldnames = ["id", "amount", "category", "date", "note"]
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(file)
+            writer.writerow(Expense._fields)
             writer.writerows(expenses)
 
+        self._last_id = None
+        self._in_field_order = True
+        self._cache = list(expenses)
+        self._cache_key = self._file_key()
+        self._reset_indexes()
+
     def add_expense(self, amount, category, date, note):
         if not self.validate_input(amount, date):
             return False, "Invalid amount or date format!"
+        date = normalize_date(date)
 
+        # only re-reads the file if it changed on disk since the last call
         expenses = self.load_expenses()
-
-        new_id = 1 if len(expenses) == 0 else int(expenses[-1]["id"]) + 1
-
-        new_exp = {
-            "id": str(new_id),
-            "amount": amount,
-            "category": category,
-            "date": date,
-            "note": note
-        }
-
+        if not self._in_field_order:
+            # rewrite once in our column order so appended rows line up
+            self.save_expenses(expenses)
+            expenses = self._cache
+
+        if self._last_id is None:
+            ids = [i for i in map(parse_id, (exp.id for exp in expenses)) if i is not None]
+            self._last_id = max(ids, default=0)
+        new_id = self._last_id + 1
+
+        # append the single new row instead of rewriting the whole file
+        with open(self.FILE_NAME, "a", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow([new_id, amount, category, date, note])
+
+        new_exp = Expense(str(new_id), str(amount), category, date, note)
         expenses.append(new_exp)
-        self.save_expenses(expenses)
+        self._last_id = new_id
+        self._cache_key = self._file_key()
+        if self._monthly is not None:
+            self._add_to_monthly(new_exp)
+        if self._by_date is not None:
+            pos = bisect_right(self._dates, date)
+            self._dates.insert(pos, date)
+            self._by_date.insert(pos, new_exp)
+        if self._by_category is not None:
+            self._by_category.setdefault(category.casefold(), []).append(new_exp)
         return True, "Expense added successfully!"
 
     def list_expenses(self):
@@ -51,20 +154,30 @@ class ExpenseManager:
 
     def filter_by_category(self, category):
         expenses = self.load_expenses()
-        return [exp for exp in expenses if exp["category"].lower() == category.lower()]
+        if self._by_category is None:
+            self._by_category = {}
+            for exp in expenses:
+                self._by_category.setdefault(exp.category.casefold(), []).append(exp)
+
+        return list(self._by_category.get(category.casefold(), []))
 
     def filter_by_date_range(self, start_date, end_date):
         expenses = self.load_expenses()
 
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
+        if not (self.validate_date(start_date) and self.validate_date(end_date)):
+            raise ValueError("Dates must be in YYYY-MM-DD format")
+
+        # ISO dates sort lexicographically, so rows are compared as strings
+        start_date = normalize_date(start_date)
+        end_date = normalize_date(end_date)
+
+        if self._by_date is None:
+            self._by_date = sorted(expenses, key=attrgetter("date"))
+            self._dates = [exp.date for exp in self._by_date]
 
-        results = []
-        for exp in expenses:
-            exp_date = datetime.strptime(exp["date"], "%Y-%m-%d")
-            if start <= exp_date <= end:
-                results.append(exp)
-        return results
+        lo = bisect_left(self._dates, start_date)
+        hi = bisect_right(self._dates, end_date)
+        return self._by_date[lo:hi]
 
     def validate_input(self, amount, date):
         try:
@@ -74,29 +187,38 @@ class ExpenseManager:
         except:
             return False
 
-        try:
-            datetime.strptime(date, "%Y-%m-%d")
-        except:
+        return self.validate_date(date)
+
+    def validate_date(self, date):
+        # 2024-1-5 is accepted like strptime did; callers store the padded form
+        match = DATE_PATTERN.fullmatch(normalize_date(date))
+        if not match:
             return False
 
-        return True
+        year, month, day = map(int, match.groups())
+        if year < 1 or not 1 <= month <= 12:
+            return False
+        return 1 <= day <= monthrange(year, month)[1]
+
+    def _add_to_monthly(self, exp):
+        month = self._monthly.setdefault(exp.date[:7], {})  # YYYY-MM
+        try:
+            amt = float(exp.amount)
+        except:
+            amt = 0  # unreadable amount counts as 0, as in the Streamlit app
+        cat = exp.category
+        month[cat] = month.get(cat, 0) + amt
 
     # ========== MONTHLY SUMMARY ADDED ==========
     def monthly_summary(self, month, year):
         expenses = self.load_expenses()
-        total = 0
-        category_summary = {}
-
-        for exp in expenses:
-            exp_date = exp["date"]  # format YYYY-MM-DD
-            y, m, d = exp_date.split("-")
-
-            if int(m) == month and int(y) == year:
-                amount = float(exp["amount"])
-                total += amount
+        if self._monthly is None:
+            self._monthly = {}
+            for exp in expenses:
+                self._add_to_monthly(exp)
 
-                cat = exp["category"]
-                category_summary[cat] = category_summary.get(cat, 0) + amount
+        category_summary = dict(self._monthly.get(f"{year:04d}-{month:02d}", {}))
+        total = sum(category_summary.values())
 
         if category_summary:
             top_category = max(category_summary, key=category_summary.get)
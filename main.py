@@ -1,6 +1,5 @@
 from expense_manager import ExpenseManager
 from report_generator import ReportGenerator
-from datetime import datetime
 
 manager = ExpenseManager()
 reporter = ReportGenerator()
@@ -39,11 +38,9 @@ while True:
 
         while True:
             date = input("Enter date (YYYY-MM-DD): ")
-            try:
-                datetime.strptime(date, "%Y-%m-%d")
+            if manager.validate_date(date):
                 break
-            except:
-                print("Invalid date format! Use YYYY-MM-DD")
+            print("Invalid date format! Use YYYY-MM-DD")
 
         note = input("Enter note: ")
 
@@ -59,7 +56,7 @@ while True:
             print("\nID | Amount | Category | Date | Note")
             print("---------------------------------------")
             for exp in expenses:
-                print(f"{exp['id']} | {exp['amount']} | {exp['category']} | {exp['date']} | {exp['note']}")
+                print(f"{exp.id} | {exp.amount} | {exp.category} | {exp.date} | {exp.note}")
 
     # --------- CATEGORY SEARCH ---------
     elif choice == "3":
@@ -71,26 +68,22 @@ while True:
         else:
             print("\nFiltered by Category:")
             for exp in results:
-                print(f"{exp['id']} | {exp['amount']} | {exp['category']} | {exp['date']} | {exp['note']}")
+                print(f"{exp.id} | {exp.amount} | {exp.category} | {exp.date} | {exp.note}")
 
     # --------- DATE RANGE SEARCH ---------
     elif choice == "4":
 
         while True:
             start = input("Enter start date (YYYY-MM-DD): ")
-            try:
-                datetime.strptime(start, "%Y-%m-%d")
+            if manager.validate_date(start):
                 break
-            except:
-                print("Invalid start date!")
+            print("Invalid start date!")
 
         while True:
             end = input("Enter end date (YYYY-MM-DD): ")
-            try:
-                datetime.strptime(end, "%Y-%m-%d")
+            if manager.validate_date(end):
                 break
-            except:
-                print("Invalid end date!")
+            print("Invalid end date!")
 
         results = manager.filter_by_date_range(start, end)
 
@@ -99,7 +92,7 @@ while True:
         else:
             print("\nFiltered by Date Range:")
             for exp in results:
-                print(f"{exp['id']} | {exp['amount']} | {exp['category']} | {exp['date']} | {exp['note']}")
+                print(f"{exp.id} | {exp.amount} | {exp.category} | {exp.date} | {exp.note}")
 
     # --------- MONTHLY SUMMARY (ExpenseManager) ---------
     elif choice == "5":
@@ -125,22 +118,21 @@ while True:
 
     # --------- FULL REPORT (ReportGenerator) ---------
     elif choice == "6":
-        expenses = manager.list_expenses()
+        report = reporter.full_report(manager.iter_expenses())
 
         print("\n===== FULL REPORT =====")
 
-        print("\nTotal Expense:", reporter.total_expense(expenses))
+        print("\nTotal Expense:", report["total_expense"])
 
         print("\nCategory Summary:")
-        category_data = reporter.category_summary(expenses)
+        category_data = report["category_summary"]
         if len(category_data) == 0:
             print("No expenses found!")
         else:
             for c, a in category_data.items():
                 print(f"  {c}: {a}")
 
-        top_cat, top_amt = reporter.top_category(expenses)
-        print("\nTop Category:", top_cat, "→", top_amt)
+        print("\nTop Category:", report["top_category"], "→", report["top_amount"])
 
     # --------- EXIT ---------
     elif choice == "7":
@@ -1,17 +1,16 @@
-from datetime import datetime
+from collections import defaultdict
+from operator import attrgetter
 
 class ReportGenerator:
 
     def total_expense(self, expenses):
-        return sum(float(exp["amount"]) for exp in expenses)
+        return sum(map(float, map(attrgetter("amount"), expenses)))
 
     def category_summary(self, expenses):
-        summary = {}
+        summary = defaultdict(float)
         for exp in expenses:
-            cat = exp["category"]
-            amt = float(exp["amount"])
-            summary[cat] = summary.get(cat, 0) + amt
-        return summary
+            summary[exp.category] += float(exp.amount)
+        return dict(summary)
 
     def top_category(self, expenses):
         summary = self.category_summary(expenses)
@@ -21,9 +20,28 @@ class ReportGenerator:
         return top_cat, summary[top_cat]
 
     def monthly_summary(self, expenses, month, year):
+        prefix = f"{year:04d}-{month:02d}-"
+        amounts = [exp.amount for exp in expenses if exp.date.startswith(prefix)]
+        return sum(map(float, amounts))
+
+    def full_report(self, expenses):
+        # total, category summary and top category in a single pass
         total = 0
+        summary = defaultdict(float)
         for exp in expenses:
-            exp_date = datetime.strptime(exp["date"], "%Y-%m-%d")
-            if exp_date.month == month and exp_date.year == year:
-                total += float(exp["amount"])
-        return total
+            amt = float(exp.amount)
+            total += amt
+            summary[exp.category] += amt
+
+        if summary:
+            top_cat = max(summary, key=summary.get)
+            top_amt = summary[top_cat]
+        else:
+            top_cat, top_amt = None, 0
+
+        return {
+            "total_expense": total,
+            "category_summary": dict(summary),
+            "top_category": top_cat,
+            "top_amount": top_amt
+        }
@@ -1,28 +1,78 @@
 import streamlit as st
 import pandas as pd
 import os
+import csv
 from datetime import datetime
-import matplotlib.pyplot as plt
+import altair as alt
 
 CSV_FILE = "storage.csv"
+EXPENSE_COLS = ["id", "amount", "category", "date", "note"]
+PAGE_SIZE = 100  # rows rendered per page in View & Filter
 
 # ------------------------------- CSV INITIAL SETUP ---------------------------------
 def init_csv():
     if not os.path.exists(CSV_FILE):
-        df = pd.DataFrame(columns=["id", "amount", "category", "date", "note"])
+        df = pd.DataFrame(columns=EXPENSE_COLS)
         df.to_csv(CSV_FILE, index=False)
 
-def load_data():
-    df = pd.read_csv(CSV_FILE)
+def file_key():
+    # changes whenever storage.csv is written, by this app or by the CLI
+    stat = os.stat(CSV_FILE)
+    return stat.st_mtime_ns, stat.st_size
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_data_cached(key):
+    # declare the text columns up front so the parser skips type inference for them;
+    # category is stored as integer codes, so filters and groupbys compare ints
+    df = pd.read_csv(CSV_FILE, dtype={"category": "category", "note": str})
     if not df.empty:
         df["amount"] = pd.to_numeric(df["amount"], errors="coerce").fillna(0)
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+        df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce")
     return df
 
+def load_data():
+    return _load_data_cached(file_key())
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _dashboard_summary(key):
+    # Dashboard figures, recomputed only when storage.csv changes
+    df = _load_data_cached(key)
+    if df.empty:
+        return None
+
+    monthly = df.groupby(df["date"].dt.to_period("M"))["amount"].sum()
+    if not monthly.empty:
+        # keep months without expenses on the chart as zero
+        monthly = monthly.reindex(
+            pd.period_range(monthly.index.min(), monthly.index.max(), freq="M"),
+            fill_value=0
+        )
+    top_cat = df.groupby("category", observed=True)["amount"].sum().sort_values(ascending=False)
+    return df["amount"].sum(), len(df), monthly.tail(12).to_timestamp(), top_cat
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _indexed_by_id(key):
+    # shared, not copied per rerun, so the ID hash table is built once per file
+    # version; callers must copy before modifying it
+    return _load_data_cached(key).set_index("id", drop=False)
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _export_bytes(key):
+    # the stored file already is the export, no need to re-encode the frame
+    with open(CSV_FILE, "rb") as file:
+        return file.read()
+
 def save_data(df):
-    df_to_save = df.copy()
-    df_to_save["date"] = df_to_save["date"].dt.strftime("%Y-%m-%d")
-    df_to_save.to_csv(CSV_FILE, index=False)
+    # format dates while writing rather than on a full copy of the frame
+    df.to_csv(CSV_FILE, index=False, date_format="%Y-%m-%d")
+
+def append_row(row):
+    # add one row at the end of the file instead of rewriting all of it
+    with open(CSV_FILE, newline="") as file:
+        header = next(csv.reader(file))
+    with open(CSV_FILE, "a", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=header, extrasaction="ignore")
+        writer.writerow(row)
 
 def generate_new_id(df):
     return 1 if df.empty else int(df["id"].max()) + 1
@@ -30,6 +80,41 @@ def generate_new_id(df):
 # Initialize CSV
 init_csv()
 
+# ------------------------------- VIEW & FILTER FRAGMENT ---------------------------------
+# Filter widgets rerun only this fragment, not the whole script
+@st.fragment
+def view_and_filter(df):
+    with st.expander("Apply Filters"):
+        cols = st.columns(3)
+
+        with cols[0]:
+            # the categorical dtype already holds the distinct names, no column scan needed
+            categories = ["All"] + sorted(df["category"].cat.categories)
+            selected_cat = st.selectbox("Category", categories)
+
+        with cols[1]:
+            start_date = st.date_input("Start date", df["date"].min().date())
+
+        with cols[2]:
+            end_date = st.date_input("End date", df["date"].max().date())
+
+    # compare as datetime64 instead of building a date object per row, and
+    # combine all conditions into one mask so only the result is copied
+    mask = (df["date"] >= pd.Timestamp(start_date)) & (df["date"] <= pd.Timestamp(end_date))
+    if selected_cat != "All":
+        mask &= df["category"] == selected_cat
+    filtered = df[mask]
+
+    st.subheader(f"Showing {len(filtered)} records")
+
+    # render one page at a time instead of shipping every row to the browser
+    total_pages = max(1, -(-len(filtered) // PAGE_SIZE))
+    # max_value is part of the widget's identity, so a new page count resets it to 1
+    page_no = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1)
+    st.caption(f"Page {page_no} of {total_pages}")
+    offset = (page_no - 1) * PAGE_SIZE
+    st.dataframe(filtered.iloc[offset:offset + PAGE_SIZE], use_container_width=True)
+
 # ------------------------------- STREAMLIT UI ---------------------------------
 st.set_page_config(
     page_title="Expense Analyzer",
@@ -49,18 +134,16 @@ page = st.sidebar.radio(
 # ------------------------------- DASHBOARD ---------------------------------
 if page == "Dashboard":
     st.header("Dashboard Summary")
-    df = load_data()
+    summary = _dashboard_summary(file_key())
 
-    if df.empty:
+    if summary is None:
         st.info("No expenses yet. Add some from 'Add Expense'.")
     else:
-        total = df["amount"].sum()
-        monthly = df.resample("M", on="date")["amount"].sum()
-        top_cat = df.groupby("category")["amount"].sum().sort_values(ascending=False)
+        total, count, monthly, top_cat = summary
 
         col1, col2, col3 = st.columns(3)
         col1.metric("Total Spending", f"₹{total:.2f}")
-        col2.metric("Total Entries", len(df))
+        col2.metric("Total Entries", count)
         top_name = top_cat.index[0]
         col3.metric("Top Category", f"{top_name} (₹{top_cat.iloc[0]:.2f})")
 
@@ -72,7 +155,7 @@ if page == "Dashboard":
 
         with col_left:
             st.subheader("Monthly Spending (Past Year)")
-            st.line_chart(monthly.tail(12))
+            st.line_chart(monthly)
 
         with col_right:
             st.subheader("Category-wise Spending")
@@ -99,18 +182,15 @@ elif page == "Add Expense":
             st.error("Invalid amount! Enter a number.")
             st.stop()
 
-        df = load_data()
         new_row = {
-            "id": generate_new_id(df),
+            "id": generate_new_id(load_data()),
             "amount": amount_val,
             "category": category.strip(),
-            "date": pd.to_datetime(date),
+            "date": date.strftime("%Y-%m-%d"),
             "note": note.strip()
         }
 
-        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-
-        save_data(df)
+        append_row(new_row)
         st.success("Expense added successfully")
 
 # ------------------------------- VIEW & FILTER ---------------------------------
@@ -121,46 +201,25 @@ elif page == "View & Filter":
     if df.empty:
         st.warning("No records found.")
     else:
-        with st.expander("Apply Filters"):
-            cols = st.columns(3)
-
-            with cols[0]:
-                categories = ["All"] + sorted(df["category"].unique())
-                selected_cat = st.selectbox("Category", categories)
-
-            with cols[1]:
-                start_date = st.date_input("Start date", df["date"].min().date())
-
-            with cols[2]:
-                end_date = st.date_input("End date", df["date"].max().date())
-
-        filtered = df.copy()
-
-        if selected_cat != "All":
-            filtered = filtered[filtered["category"] == selected_cat]
-
-        filtered = filtered[
-            (filtered["date"].dt.date >= start_date) &
-            (filtered["date"].dt.date <= end_date)
-        ]
-
-        st.subheader(f"Showing {len(filtered)} records")
-        st.dataframe(filtered, use_container_width=True)
+        view_and_filter(df)
 
 # ------------------------------- EDIT / DELETE ---------------------------------
 elif page == "Edit / Delete":
     st.header("Edit or Delete Expense")
 
-    df = load_data()
+    # hash lookups by ID instead of scanning the column for each access
+    by_id = _indexed_by_id(file_key())
 
-    if df.empty:
+    if by_id.empty:
         st.info("No records to edit or delete")
     else:
-        ids = df["id"].tolist()
-        selected_id = st.selectbox("Choose ID", [None] + ids)
+        # look the ID up on demand rather than rendering every ID as an option
+        selected_id = st.number_input("Expense ID", min_value=0, value=0, step=1)
 
-        if selected_id:
-            row = df[df["id"] == selected_id].iloc[0]
+        if selected_id and selected_id not in by_id.index:
+            st.warning(f"No expense with ID {selected_id}")
+        elif selected_id:
+            row = by_id.loc[[selected_id]].iloc[0]
 
             with st.form("edit_form"):
                 amt = st.text_input("Amount", value=str(row["amount"]))
@@ -171,21 +230,36 @@ elif page == "Edit / Delete":
 
             if save_btn:
                 try:
-                    df.loc[df["id"] == selected_id, ["amount", "category", "date", "note"]] = [
+                    edited = by_id.copy()
+                    if cat not in edited["category"].cat.categories:
+                        edited["category"] = edited["category"].cat.add_categories([cat])
+                    edited.loc[selected_id, ["amount", "category", "date", "note"]] = [
                         float(amt), cat, pd.to_datetime(date), note
                     ]
-                    save_data(df)
+                    save_data(edited)
                     st.success("Record updated")
                 except:
                     st.error("Invalid input!")
 
         st.markdown("---")
-        delete_list = st.multiselect("Select IDs to delete", ids)
+        # typed IDs, checked against the index, instead of a multiselect of every ID
+        delete_text = st.text_input("IDs to delete (comma-separated)")
 
         if st.button("Delete Selected"):
-            df = df[~df["id"].isin(delete_list)]
-            save_data(df)
-            st.success("Selected records deleted")
+            try:
+                delete_list = [int(part) for part in delete_text.split(",") if part.strip()]
+            except:
+                st.error("IDs must be whole numbers")
+                st.stop()
+
+            missing = [i for i in delete_list if i not in by_id.index]
+            if not delete_list:
+                st.warning("Enter at least one ID")
+            elif missing:
+                st.warning(f"No expense with ID {', '.join(map(str, missing))}")
+            else:
+                save_data(by_id[~by_id.index.isin(delete_list)])
+                st.success("Selected records deleted")
 
 # ------------------------------- REPORTS ---------------------------------
 elif page == "Reports":
@@ -195,7 +269,7 @@ elif page == "Reports":
     if df.empty:
         st.info("No data available")
     else:
-        cat_summary = df.groupby("category")["amount"].sum()
+        cat_summary = df.groupby("category", observed=True)["amount"].sum()
 
         col_left, col_space, col_right = st.columns([1, 0.15, 1])
 
@@ -205,15 +279,19 @@ elif page == "Reports":
 
         with col_right:
             st.subheader("Category Distribution")
-            fig, ax = plt.subplots()
-            ax.pie(
-                cat_summary.values,
-                labels=cat_summary.index,
-                autopct="%1.1f%%",
-                startangle=90
+            # rendered in the browser by Vega-Lite, no server-side figure
+            pie_data = cat_summary.reset_index()
+            pie_data["share"] = pie_data["amount"] / pie_data["amount"].sum()
+            base = alt.Chart(pie_data).encode(
+                theta=alt.Theta("amount", stack=True),
+                color="category",
+                tooltip=["category", "amount", alt.Tooltip("share", format=".1%")]
+            )
+            # label each slice with its percentage, as the matplotlib pie did
+            labels = base.mark_text(radius=130).encode(
+                text=alt.Text("share", format=".1%")
             )
-            ax.axis("equal")
-            st.pyplot(fig)
+            st.altair_chart(base.mark_arc(outerRadius=100) + labels, use_container_width=True)
 
 # ------------------------------- EXPORT / IMPORT ---------------------------------
 elif page == "Export/Import":
@@ -227,14 +305,13 @@ elif page == "Export/Import":
         if df.empty:
             st.info("No data to export.")
         else:
-            csv = df.to_csv(index=False).encode()
-            st.download_button("Download CSV", csv, "expenses.csv")
+            st.download_button("Download CSV", _export_bytes(file_key()), "expenses.csv")
 
     with col2:
         uploaded = st.file_uploader("Upload CSV", type=["csv"])
         if uploaded:
             try:
-                new_df = pd.read_csv(uploaded)
+                new_df = pd.read_csv(uploaded, usecols=EXPENSE_COLS)
                 save_data(new_df)
                 st.success("Uploaded and replaced existing data")
             except: